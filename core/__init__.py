@@ -1,6 +1,7 @@
 from core.state_manager import (
     State,
     StateManager,
+    StateTransition,
     get_nested_paths,
     get_paths,
 )
@@ -3,43 +3,43 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
-    from game_state import State
+    from core.state_manager import State
 
 
 class BaseError(Exception):
     """The base class to all custom errors."""
 
+    __slots__ = ("last_state",)
+
     def __init__(self, *args, last_state: Optional[State] = None, **kwargs) -> None:
         super().__init__(*args)
 
         self.last_state = last_state
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+        if kwargs:
+            # Extra attributes fall back to the instance `__dict__`, which is only
+            # allocated when there's something to store.
+            self.__dict__.update(kwargs)
 
 
 class StateError(BaseError):
     """Raised when an operation is done over an invalid state."""
 
-    def __init__(self, *args, last_state: Optional[State] = None, **kwargs) -> None:
-        super().__init__(*args, last_state=last_state, **kwargs)
+    __slots__ = ()
 
 
 class StateLoadError(BaseError):
     """Raised when an error occurs in loading / unloading a state."""
 
-    def __init__(self, *args, last_state: Optional[State] = None, **kwargs) -> None:
-        super().__init__(*args, last_state=last_state, **kwargs)
+    __slots__ = ()
 
 
 class ExitStateError(BaseError):
     """An error class used to exit the current state."""
 
-    def __init__(self, *args, last_state: Optional[State] = None, **kwargs) -> None:
-        super().__init__(*args, last_state=last_state, **kwargs)
+    __slots__ = ()
 
 
 class ExitGameError(BaseError):
     """An error class used to exit out of the game"""
 
-    def __init__(self, *args, last_state: Optional[State] = None, **kwargs) -> None:
-        super().__init__(*args, last_state=last_state, **kwargs)
+    __slots__ = ()
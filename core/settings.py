@@ -1,4 +1,5 @@
-from typing import Tuple, Union, Sequence, TypeAlias, Dict
+from enum import IntEnum
+from typing import Tuple, Union, Sequence, TypeAlias, Dict, Final, FrozenSet
 from pygame import Vector2
 
 ColourType: TypeAlias = Union[int, str, Sequence[int]]
@@ -13,6 +14,10 @@ class Display:
         (1280, 720),  # ok
         (1024, 600),  # overlay check
     )
+    RESOLUTION_SET: FrozenSet[Tuple[int, int]] = frozenset(ALL_RESOLUTIONS)
+    INDEX_BY_RESOLUTION: Dict[Tuple[int, int], int] = {
+        resolution: index for index, resolution in enumerate(ALL_RESOLUTIONS)
+    }
     FPS: int = 120
 
 
@@ -20,32 +25,86 @@ TILE_SIZE: int = 64
 
 BACKGROUND_COLOUR: ColourType = "black"
 
+LAYER_WATER: Final[int] = 0
+LAYER_GROUND: Final[int] = 1
+LAYER_SOIL: Final[int] = 2
+LAYER_SOIL_WATER: Final[int] = 3
+LAYER_RAIN_FLOOR: Final[int] = 4
+LAYER_HOUSE_BOTTOM: Final[int] = 5
+LAYER_GROUND_PLANT: Final[int] = 6
+LAYER_MAIN: Final[int] = 7
+LAYER_HOUSE_TOP: Final[int] = 8
+LAYER_FRUIT: Final[int] = 9
+LAYER_RAIN_DROPS: Final[int] = 10
+
 LAYERS: Dict[str, int] = {
-    "water": 0,
-    "ground": 1,
-    "soil": 2,
-    "soil_water": 3,
-    "rain_floor": 4,
-    "house_bottom": 5,
-    "ground_plant": 6,
-    "main": 7,
-    "house_top": 8,
-    "fruit": 9,
-    "rain_drops": 10,
+    "water": LAYER_WATER,
+    "ground": LAYER_GROUND,
+    "soil": LAYER_SOIL,
+    "soil_water": LAYER_SOIL_WATER,
+    "rain_floor": LAYER_RAIN_FLOOR,
+    "house_bottom": LAYER_HOUSE_BOTTOM,
+    "ground_plant": LAYER_GROUND_PLANT,
+    "main": LAYER_MAIN,
+    "house_top": LAYER_HOUSE_TOP,
+    "fruit": LAYER_FRUIT,
+    "rain_drops": LAYER_RAIN_DROPS,
 }
 
-PLAYER_TOOL_OFFSET: Dict[str, Vector2] = {
-    "left": Vector2(-50, 40),
-    "right": Vector2(50, 40),
-    "up": Vector2(0, -10),
-    "down": Vector2(0, 50),
-}
+TOOL_OFFSET_LEFT: Final[Vector2] = Vector2(-50, 40)
+TOOL_OFFSET_RIGHT: Final[Vector2] = Vector2(50, 40)
+TOOL_OFFSET_UP: Final[Vector2] = Vector2(0, -10)
+TOOL_OFFSET_DOWN: Final[Vector2] = Vector2(0, 50)
+
+
+class Direction(IntEnum):
+    LEFT = 0
+    RIGHT = 1
+    UP = 2
+    DOWN = 3
+
+
+# Both indexed by `Direction`.
+DIRECTION_NAMES: Tuple[str, ...] = ("left", "right", "up", "down")
+PLAYER_TOOL_OFFSET_TUPLE: Tuple[Vector2, ...] = (
+    TOOL_OFFSET_LEFT,
+    TOOL_OFFSET_RIGHT,
+    TOOL_OFFSET_UP,
+    TOOL_OFFSET_DOWN,
+)
+
+PLAYER_TOOL_OFFSET: Dict[str, Vector2] = dict(
+    zip(DIRECTION_NAMES, PLAYER_TOOL_OFFSET_TUPLE)
+)
+
+APPLE_POS_SMALL: Final[Tuple[Tuple[int, int], ...]] = (
+    (18, 17),
+    (30, 37),
+    (12, 50),
+    (30, 45),
+    (20, 30),
+    (30, 10),
+)
+APPLE_POS_LARGE: Final[Tuple[Tuple[int, int], ...]] = (
+    (30, 24),
+    (50, 65),
+    (50, 50),
+    (16, 40),
+    (45, 50),
+    (42, 70),
+)
 
 APPLE_POS: Dict[str, Tuple[Tuple[int, int], ...]] = {
-    "Small": ((18, 17), (30, 37), (12, 50), (30, 45), (20, 30), (30, 10)),
-    "Large": ((30, 24), (50, 65), (50, 50), (16, 40), (45, 50), (42, 70)),
+    "Small": APPLE_POS_SMALL,
+    "Large": APPLE_POS_LARGE,
 }
 
+# Soil grid cell flags
+SOIL_FARMABLE: Final[int] = 1
+SOIL_TILLED: Final[int] = 2
+SOIL_WATERED: Final[int] = 4
+SOIL_PLANTED: Final[int] = 8
+
 GROW_SPEED = {"corn": 1, "tomato": 0.7}
 
 SALE_PRICES = {
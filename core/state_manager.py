@@ -5,19 +5,46 @@ This file contains classes related to screen management / screen changing.
 from __future__ import annotations
 
 import os
+import re
+import sys
 import pygame
+import operator
+import functools
 import importlib
 
-from typing import Dict, Optional, Iterable, List
-from core.errors import StateError, StateLoadError, ExitStateError, ExitGameError
+from enum import IntEnum
+from types import MappingProxyType
+from typing import (
+    Dict,
+    FrozenSet,
+    Optional,
+    Iterable,
+    KeysView,
+    List,
+    Mapping,
+)
+from core.errors import StateError, StateLoadError, ExitGameError
+
+
+_SEP_TABLE = str.maketrans("/\\", "..")
+_REPEATED_DOTS = re.compile(r"\.{2,}")
+_get_hook = operator.attrgetter("hook")
+
+
+class StateTransition(IntEnum):
+    NO_STATE = 0
+    EXITED = 1
 
 
 class State:
     window: Optional[pygame.Surface] = None
     manager: Optional[StateManager] = None
 
-    def __init__(self) -> None:
-        self.clock = pygame.time.Clock()
+    @functools.cached_property
+    def clock(self) -> pygame.time.Clock:
+        """The State's clock, only created once it's first used."""
+
+        return pygame.time.Clock()
 
     def setup(self) -> None:
         """This method is only called once before `State.run`, i.e right after the class
@@ -32,7 +59,9 @@ class State:
 class StateManager:
     __slots__ = (
         "__states",
+        "__states_view",
         "__current_state",
+        "__current_state_name",
         "__last_state",
     )
 
@@ -48,7 +77,9 @@ class StateManager:
         State.manager = self
 
         self.__states: Dict[str, State] = {}
+        self.__states_view: Mapping[str, State] = MappingProxyType(self.__states)
         self.__current_state: Optional[State] = None
+        self.__current_state_name: Optional[str] = None
         self.__last_state: Optional[State] = None
 
     def connect_state_hook(self, path: str, **kwargs) -> None:
@@ -68,17 +99,21 @@ class StateManager:
             Raised when the hook function was not found in the state file to be loaded.
         """
 
-        state = importlib.import_module(path)
-        if "hook" not in state.__dict__:
+        # Already imported modules skip the import machinery entirely. The hook is
+        # looked up on every call so `importlib.reload`ed state files are respected.
+        state = sys.modules.get(path) or importlib.import_module(path)
+        try:
+            hook = _get_hook(state)
+        except AttributeError:
             raise StateError(
                 "\nAn error occurred in loading State Path-\n"
                 f"`{path}`\n"
                 "`hook` function was not found in state file to load.\n",
                 last_state=self.__last_state,
                 **kwargs,
-            )
+            ) from None
 
-        state.__dict__["hook"](**kwargs)
+        hook(**kwargs)
 
     def load_states(self, *states: type[State], force: bool = False, **kwargs) -> None:
         """Loads the States into the StateManager.
@@ -103,15 +138,17 @@ class StateManager:
         """
 
         for state in states:
-            if not force and state.__name__ in self.__states:
+            name = state.__name__
+            if not force and name in self.__states:
                 raise StateLoadError(
-                    f"State: {state.__name__} has already been loaded.",
+                    f"State: {name} has already been loaded.",
                     last_state=self.__last_state,
                     **kwargs,
                 )
 
-            self.__states[state.__name__] = state(**kwargs)
-            self.__states[state.__name__].setup()
+            instance = state(**kwargs)
+            self.__states[name] = instance
+            instance.setup()
 
     def unload_state(
         self, state_name: str, force: bool = False, **kwargs
@@ -146,6 +183,7 @@ class StateManager:
             Only raised when `force` is set to `False`.
         """
 
+        state_name = sys.intern(state_name)
         if state_name not in self.__states:
             raise StateLoadError(
                 f"State: {state_name} doesn't exist to be unloaded.",
@@ -153,20 +191,14 @@ class StateManager:
                 **kwargs,
             )
 
-        elif (
-            not force 
-            and self.__current_state is not None
-            and state_name == self.__current_state.__name__
-        ):
+        elif not force and state_name == self.__current_state_name:
             raise StateError(
                 "Cannot unload an actively running state.",
                 last_state=self.__last_state,
                 **kwargs,
             )
 
-        cls_ref = self.__states[state_name].__class__
-        del self.__states[state_name]
-        return cls_ref
+        return self.__states.pop(state_name).__class__
 
     def reload_state(self, state_name: str, force: bool = False, **kwargs) -> State:
         """Reloads the specified State. A short hand to `StateManager.unload_state` &
@@ -196,6 +228,7 @@ class StateManager:
             Raised when the state has already been loaded.
         """
 
+        state_name = sys.intern(state_name)
         deleted_cls = self.unload_state(state_name=state_name, force=force, **kwargs)
         self.load_states(deleted_cls, force=force, **kwargs)
         return self.__states[state_name]
@@ -222,16 +255,28 @@ class StateManager:
 
         return self.__last_state
 
-    def get_state_map(self) -> Dict[str, State]:
-        """Gets the dictionary copy of all states.
+    def get_all_states(self) -> KeysView[str]:
+        """Gets the names of all loaded states.
+
+        Returns
+        --------
+        KeysView[:class:`str`]
+            Returns a live view of the names of all loaded states.
+        """
+
+        return self.__states.keys()
+
+    def get_state_map(self) -> Mapping[str, State]:
+        """Gets a read-only view of all states. Use `dict(manager.get_state_map())`
+        for a mutable copy.
 
         Returns
         --------
-        Dict[:class:`str`, :class:`State`]
-            Returns the dictionary copy of all states.
+        Mapping[:class:`str`, :class:`State`]
+            Returns a read-only mapping of all states.
         """
 
-        return self.__states.copy()
+        return self.__states_view
 
     def change_state(self, state_name: str) -> None:
         """Changes the current state and updates the last state.
@@ -243,44 +288,37 @@ class StateManager:
 
         Raises
         ------
-        :exc:`AssertionError`
+        :exc:`StateError`
             Raised when the state name doesn't exist in the manager.
         """
 
-        assert (
-            state_name in self.__states
-        ), f"State `{state_name}` isn't present from the available states: "
-        f"`{', '.join(self.get_state_map().keys())}`."
+        state_name = sys.intern(state_name)
+        if state_name not in self.__states:
+            raise StateError(
+                f"State `{state_name}` isn't present from the available states: "
+                f"`{', '.join(self.__states)}`.",
+                last_state=self.__last_state,
+            )
 
         self.__last_state = self.__current_state
         self.__current_state = self.__states[state_name]
+        self.__current_state_name = state_name
 
-    def update_state(self, **kwargs) -> None:
-        """Updates the changed State to take place.
-
-        Parameters
-        ----------
-        **kwargs:
-            The keyword arguments to be passed on to the raised errors.
-
-        Raises
-        ------
-        :exc:`ExitStateError`
-            Raised when the state has successfully exited.
+    def update_state(self) -> StateTransition:
+        """Updates the changed State to take place. The running State's `run` method
+        should return once this gives back `StateTransition.EXITED`, handing control
+        back to `StateManager.run_state`'s caller.
 
-        :exc:`StateError`
-            Raised when the current state is `None` i.e having no State to update to.
+        Returns
+        --------
+        :class:`StateTransition`
+            `StateTransition.EXITED` when the state has successfully exited or
+            `StateTransition.NO_STATE` when there's no State to update to.
         """
 
         if self.__current_state is not None:
-            raise ExitStateError(
-                "State has successfully exited.", last_state=self.__last_state, **kwargs
-            )
-        raise StateError(
-            "No state has been set to exit from.",
-            last_state=self.__last_state,
-            **kwargs,
-        )
+            return StateTransition.EXITED
+        return StateTransition.NO_STATE
 
     def run_state(self, **kwargs) -> None:
         """The entry point to running the StateManager. To be only called once. For
@@ -314,11 +352,8 @@ class StateManager:
 
         Raises
         ------
-        :exc:`ExitStateError`
-            Raised when the state has successfully exited.
-
-        :exc:`StateError`
-            Raised when the current state is `None` i.e having no State to update to.
+        :exc:`ExitGameError`
+            Always raised, to be caught by the game's entry point.
         """
 
         raise ExitGameError(
@@ -326,6 +361,24 @@ class StateManager:
         )
 
 
+def _scan_paths(
+    folder_dir: str,
+    ignore_files: FrozenSet[str],
+    ignore_folders: FrozenSet[str],
+    paths: List[str],
+) -> None:
+    with os.scandir(folder_dir) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in ignore_folders:
+                    _scan_paths(entry.path, ignore_files, ignore_folders, paths)
+
+            elif entry.name.endswith(".py") and entry.name not in ignore_files:
+                paths.append(
+                    _REPEATED_DOTS.sub(".", entry.path[:-3].translate(_SEP_TABLE))
+                )
+
+
 def get_nested_paths(
     folder_dir: str,
     ignore_files: Iterable[str] = ("__init__.py",),
@@ -342,7 +395,7 @@ def get_nested_paths(
         Ignores these files from the final list of paths.
 
     ignore_folders: :class:`Iterable[str]`, default `("__pycache__",)`
-        Ignores files present in these folders.
+        Ignores these folders along with every file & folder nested inside them.
 
     Returns
     --------
@@ -350,23 +403,8 @@ def get_nested_paths(
         Returns a list containing the paths of all nested python files.
     """
 
-    paths = []
-    next_dir = None
-
-    for dirpath, dirnames, filenames in os.walk(folder_dir):
-        if next_dir in ignore_folders:
-            continue
-        if len(dirnames) > 0:
-            next_dir = dirnames[0]
-
-        for file in filenames:
-            if file not in ignore_files and file.endswith(".py"):
-                paths.append(
-                    rf"{dirpath}/{file[:-3]}".replace("//", ".")
-                    .replace("/", ".")
-                    .replace("\\", ".")
-                    .replace("\\\\", ".")
-                )
+    paths: List[str] = []
+    _scan_paths(folder_dir, frozenset(ignore_files), frozenset(ignore_folders), paths)
     return paths
 
 
@@ -390,12 +428,11 @@ def get_paths(
     """
 
     paths = []
+    ignore_files = frozenset(ignore_files)
 
-    for dirpath, _, filenames in os.walk(folder_dir):
-        for file in filenames:
-            if file not in ignore_files and file.endswith(".py"):
-                paths.append(
-                    rf"{dirpath + file[:-3]}".replace("/", ".").replace("\\", ".")
-                )
-        break
+    with os.scandir(folder_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".py") and name not in ignore_files and entry.is_file():
+                paths.append(f"{folder_dir}{name[:-3]}".translate(_SEP_TABLE))
     return paths
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import pygame
+import functools
 from dataclasses import dataclass
 from collections.abc import Callable
 from typing import (
@@ -36,8 +37,19 @@ class TextStyle:
         )
 
 
+def _hashable(
+    colour: Optional[Union[int, str, Sequence[int]]]
+) -> Optional[Union[int, str, Tuple[int, ...]]]:
+    if colour is None or isinstance(colour, (int, str)):
+        return colour
+    return tuple(colour)
+
+
 class Text:
-    __slots__ = ("window", "center", "text_style", "text_size", "font", "rect")
+    __slots__ = ("window", "center", "text_style", "text_size", "font", "rect", "cache")
+
+    # Maximum number of rendered surfaces kept, the oldest is dropped first.
+    CACHE_SIZE = 64
 
     def __init__(
         self,
@@ -61,6 +73,30 @@ class Text:
             )
 
         self.rect: Optional[pygame.Rect] = None
+        self.cache: Dict[tuple, pygame.Surface] = {}
+
+    def prerender(
+        self,
+        text: str,
+        colour: Optional[Union[int, str, Sequence[int]]] = None,
+        text_bg_colour: Optional[Union[int, str, Sequence[int]]] = None,
+        antialias: bool = True,
+    ) -> pygame.Surface:
+        """Renders the text without drawing it. The same text & colours are only ever
+        rendered once while they're in the cache, so static text can be prerendered and
+        blitted directly."""
+
+        colour = colour or self.text_style.text_colour
+        text_bg_colour = text_bg_colour or self.text_style.text_bg_colour
+        key = (text, _hashable(colour), _hashable(text_bg_colour), antialias)
+
+        rendered_text = self.cache.get(key)
+        if rendered_text is None:
+            rendered_text = self.font.render(text, antialias, colour, text_bg_colour)
+            if len(self.cache) >= self.CACHE_SIZE:
+                del self.cache[next(iter(self.cache))]
+            self.cache[key] = rendered_text
+        return rendered_text
 
     def render(
         self,
@@ -69,18 +105,24 @@ class Text:
         text_bg_colour: Optional[Union[int, str, Sequence[int]]] = None,
         antialias: bool = True,
     ) -> None:
-        rendered_text = self.font.render(
-            text,
-            antialias,
-            colour or self.text_style.text_colour,
-            text_bg_colour or self.text_style.text_bg_colour,
-        )
+        rendered_text = self.prerender(text, colour, text_bg_colour, antialias)
         if self.rect is None:
             self.rect = rendered_text.get_rect(center=self.center)
         self.window.blit(rendered_text, self.rect)
 
 
 class Animation:
+    __slots__ = (
+        "frames",
+        "sprite",
+        "speed",
+        "ignore_invalid_state",
+        "status",
+        "status_frames",
+        "current_frame",
+        "frame_count",
+    )
+
     def __init__(
         self,
         frames: Dict[str, List[pygame.Surface]],
@@ -96,13 +138,14 @@ class Animation:
         self.ignore_invalid_state = ignore_invalid_state
 
         self.status: Optional[str] = None
+        self.status_frames: Sequence[pygame.Surface] = ()
         self.current_frame = 0
-        self.max_frames = 0
+        self.frame_count = 1
         if start_status is not None:
             self.set_status(start_status)
 
     def get_frame(self, frame: int) -> pygame.Surface:
-        return self.frames[self.status][frame]
+        return self.status_frames[frame]
 
     def set_status(self, animation: str) -> None:
         if not self.ignore_invalid_state:
@@ -110,11 +153,11 @@ class Animation:
                 animation in self.frames
             ), f"{animation} is not present in list of animations: {self.frames.keys()}"
 
-        if animation in self.frames:
-            # if animation != self.status:
+        if animation != self.status and animation in self.frames:
             self.status = animation
             # self.current_frame = 0
-            self.max_frames = len(self.frames[self.status]) - 1
+            self.status_frames = self.frames[animation]
+            self.frame_count = len(self.status_frames)
 
     def play_status(self, dt: int) -> pygame.Surface:
         if not self.ignore_invalid_state:
@@ -123,22 +166,24 @@ class Animation:
             ), "No animation state has been set to run"
 
         self.current_frame += self.speed * dt
-        if self.current_frame > self.max_frames:
-            self.current_frame = 0
+        if self.current_frame >= self.frame_count:
+            self.current_frame %= self.frame_count
 
-        return self.frames[self.status][round(self.current_frame)]
+        return self.status_frames[int(self.current_frame)]
 
     def play_status_ip(self, dt: int) -> None:
         assert (
             self.sprite is not None
         ), "No sprite has been passed to play the status in-place."
         self.current_frame += self.speed * dt
-        if self.current_frame > self.max_frames:
-            self.current_frame = 0
-        self.sprite.image = self.frames[self.status][round(self.current_frame)]
+        if self.current_frame >= self.frame_count:
+            self.current_frame %= self.frame_count
+        self.sprite.image = self.status_frames[int(self.current_frame)]
 
 
 class Timer:
+    __slots__ = ("duration", "func", "start_time", "active")
+
     def __init__(self, duration: int, func: Optional[Callable] = None) -> None:
         self.duration = duration
         self.func = func
@@ -153,8 +198,12 @@ class Timer:
         self.active = False
         self.start_time = 0
 
-    def update(self):
-        current_time = pygame.time.get_ticks()
+    def update(self, current_time: Optional[int] = None) -> None:
+        if not self.active:
+            return
+
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
         if current_time - self.start_time >= self.duration:
             if self.func and self.start_time != 0:
                 self.func()
@@ -162,12 +211,16 @@ class Timer:
 
 
 class ItemIterator(Generic[T]):
+    __slots__ = ("inv", "seq", "index", "selected", "max_index")
+
     def __init__(self, seq: List[T]) -> None:
-        self.seq = seq
+        # `inv` is the source of truth, `seq` is an indexable copy of its keys
+        # that's only rebuilt when items are added / removed.
+        self.inv: Dict[T, int] = dict.fromkeys(seq, 1)
+        self.seq: List[T] = list(self.inv)
         self.index = 0
-        self.selected = seq[0]
-        self.max_index = len(seq) - 1
-        self.inv: Dict[T, int] = {key: 1 for key in seq}
+        self.selected = self.seq[0]
+        self.max_index = len(self.seq) - 1
 
     def next(self) -> None:
         self.index += 1
@@ -182,47 +235,68 @@ class ItemIterator(Generic[T]):
         self.selected = self.seq[self.index]
 
     def append(self, element: T) -> None:
-        self.seq.append(element)
         self.inv[element] = 0
-        self.max_index += 1
+        self.seq = list(self.inv)
+        self.max_index = len(self.seq) - 1
 
     def remove(self, element: T) -> None:
-        self.seq.remove(element)
         del self.inv[element]
-        self.max_index -= 1
+        self.seq = list(self.inv)
+        self.max_index = len(self.seq) - 1
 
     def update_item(self, amount: int = 1, item: Optional[T] = None) -> None:
         item = item or self.selected
-        if item not in self.seq:
+        if item not in self.inv:
             self.append(item)
         self.inv[item] += amount
 
     def set_item(self, item: T, value: int) -> None:
-        self.inv[item] = value
-        if item not in self.seq:
+        if item not in self.inv:
             self.append(item)
+        self.inv[item] = value
+
+
+@functools.lru_cache(maxsize=None)
+def load_image(path: str) -> pygame.Surface:
+    """Loads & converts an image once, every later call shares the same surface."""
+    return pygame.image.load(path).convert_alpha()
+
+
+@functools.lru_cache(maxsize=None)
+def load_sound(path: str) -> pygame.mixer.Sound:
+    """Loads a sound once, every later call shares the same sound."""
+    return pygame.mixer.Sound(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _import_folder(path: str) -> Tuple[pygame.Surface, ...]:
+    return tuple(
+        load_image(os.path.join(folder, image))
+        for folder, _, image_files in os.walk(path)
+        for image in image_files
+    )
+
+
+def import_folder(path: str) -> Tuple[pygame.Surface, ...]:
+    return _import_folder(os.path.abspath(path))
 
 
-def import_folder(path: str) -> List[pygame.Surface]:
-    surface_list = []
-    for folder, _, image_files in os.walk(path):
-        for image in image_files:
-            full_path = f"{folder}/{image}"
-            surface = pygame.image.load(full_path).convert_alpha()
-            surface_list.append(surface)
-    return surface_list
+def import_folder_dict(path: str) -> Dict[str, pygame.Surface]:
+    path = os.path.abspath(path)
+    with os.scandir(path) as entries:
+        return {
+            entry.name.split(".")[0]: load_image(entry.path)
+            for entry in entries
+            if entry.is_file()
+        }
 
 
-def import_folder_dict(path: str) -> dict:
-    surface_dict = {}
+_ASSETS_ROOT = os.path.join(os.path.dirname(os.path.dirname(__file__)), "graphics")
 
-    for _, __, img_files in os.walk(path):
-        for image in img_files:
-            full_path = path + "/" + image
-            image_surf = pygame.image.load(full_path).convert_alpha()
-            surface_dict[image.split(".")[0]] = image_surf
 
-    return surface_dict
+def asset(*parts: str) -> str:
+    """Joins the path parts onto the absolute path of the `graphics` folder."""
+    return os.path.join(_ASSETS_ROOT, *parts)
 
 
 def get_path(path: str) -> str:
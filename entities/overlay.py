@@ -1,18 +1,49 @@
 import pygame
 
+from typing import Optional
+
 from core.settings import Display, COIN_ANIMATIONS, BG_COLOUR
-from core.utils import Animation, import_folder, import_folder_dict, get_path
+from core.utils import (
+    Animation,
+    import_folder,
+    import_folder_dict,
+    load_image,
+    asset,
+)
 from entities.player import Player
 
+_TOOL_CENTER = (Display.SCREEN_RESOLUTION[0] / 1.2, Display.SCREEN_RESOLUTION[1] / 1.3)
+_COIN_CENTER = (Display.SCREEN_RESOLUTION[0] / 1.25, Display.SCREEN_RESOLUTION[1] / 5)
+_TEXT_CENTER = (Display.SCREEN_RESOLUTION[0] / 1.2, Display.SCREEN_RESOLUTION[1] / 1.17)
+_MONEY_CENTER = (Display.SCREEN_RESOLUTION[0] / 1.2, Display.SCREEN_RESOLUTION[1] / 5)
+
 
 class Overlay:
+    __slots__ = (
+        "display_surface",
+        "player",
+        "font",
+        "coin_animation",
+        "tools_surf",
+        "tool_rects",
+        "all_tool_rect",
+        "coin_rect",
+        "money_bg_bounds",
+        "money_bg_topleft",
+        "money_bg_rect",
+        "tool_bg_rect",
+        "inv_amount",
+        "inv_amount_surf",
+        "inv_amount_rect",
+        "money",
+        "money_surf",
+        "money_rect",
+    )
+
     def __init__(self, player: Player, display: pygame.Surface) -> None:
         self.display_surface = display
         self.player = player
-        self.font = pygame.font.Font(
-            get_path(r"..\graphics\LycheeSoda.ttf"),
-            30,
-        )
+        self.font = pygame.font.Font(asset("LycheeSoda.ttf"), 30)
 
         self.coin_animation = Animation(
             {"coin": [image for image in import_folder(COIN_ANIMATIONS)]},
@@ -20,83 +51,80 @@ class Overlay:
             speed=10,
         )
 
-        overlay_path = get_path("../graphics/images/overlay/")
-        fruit_path = get_path("../graphics/images/fruit")
+        self.tools_surf = import_folder_dict(asset("images", "overlay"))
+        self.tools_surf["apple"] = load_image(asset("images", "fruit", "apple.png"))
 
-        self.tools_surf = import_folder_dict(get_path(overlay_path))
-        self.tools_surf["apple"] = pygame.image.load(
-            f"{fruit_path}/apple.png"
-        ).convert_alpha()
+        self.tool_rects = {
+            tool: surf.get_rect(center=_TOOL_CENTER)
+            for tool, surf in self.tools_surf.items()
+        }
+        self.all_tool_rect = self.tool_rects[self.player.inventory.selected]
 
-        self.all_tool_rect = self.tools_surf[self.player.inventory.selected].get_rect(
-            center=(
-                Display.SCREEN_RESOLUTION[0] / 1.2,
-                Display.SCREEN_RESOLUTION[1] / 1.3,
-            )
-        )
+        # All coin frames share the same size.
+        self.coin_rect = self.coin_animation.get_frame(0).get_rect(center=_COIN_CENTER)
 
-    def draw(self, dt: int) -> None:
-        tool_surf = self.tools_surf[self.player.inventory.selected]
-        tool_rect = tool_surf.get_rect(
-            center=(
-                Display.SCREEN_RESOLUTION[0] / 1.2,
-                Display.SCREEN_RESOLUTION[1] / 1.3,
-            )
+        # Darkened panels behind the money & tool, multiplied straight onto the
+        # display instead of blitting freshly filled surfaces each frame.
+        self.money_bg_bounds = pygame.Rect((0, 0), self.coin_rect.topleft)
+        self.money_bg_topleft = (
+            self.money_bg_bounds.move(self.coin_rect.topleft).inflate(20, 15).topleft
         )
+        self.money_bg_rect = pygame.Rect(self.money_bg_topleft, (0, 0))
 
-        coin_surf = self.coin_animation.play_status(dt=dt)
-        coin_rect = coin_surf.get_rect(
-            center=(
-                Display.SCREEN_RESOLUTION[0] / 1.25,
-                Display.SCREEN_RESOLUTION[1] / 5,
-            )
+        tool_bg_topleft = (
+            self.money_bg_bounds.move(self.all_tool_rect.topleft)
+            .inflate(100, 100)
+            .topleft
         )
-
-        inv_amount_surf = self.font.render(
-            f"x{self.player.inventory.inv[self.player.inventory.selected]}",
-            False,
-            "white",
-        )
-        inv_amount_rect = inv_amount_surf.get_rect(
-            center=(
-                Display.SCREEN_RESOLUTION[0] / 1.2,
-                Display.SCREEN_RESOLUTION[1] / 1.17,
-            )
+        self.tool_bg_rect = pygame.Rect(
+            tool_bg_topleft,
+            self.all_tool_rect.inflate(300, 400)
+            .clip(pygame.Rect((0, 0), self.all_tool_rect.topleft))
+            .size,
         )
 
-        money_surf = self.font.render(f"{self.player.money}", False, "white")
-        money_rect = money_surf.get_rect(
-            center=(
-                Display.SCREEN_RESOLUTION[0] / 1.2,
-                Display.SCREEN_RESOLUTION[1] / 5,
+        # Text is only re-rendered when the value it shows changes.
+        self.inv_amount: Optional[int] = None
+        self.inv_amount_surf: Optional[pygame.Surface] = None
+        self.inv_amount_rect: Optional[pygame.Rect] = None
+        self.money: Optional[int] = None
+        self.money_surf: Optional[pygame.Surface] = None
+        self.money_rect: Optional[pygame.Rect] = None
+
+    def update_text(self) -> None:
+        inv_amount = self.player.inventory.inv[self.player.inventory.selected]
+        if inv_amount != self.inv_amount:
+            self.inv_amount = inv_amount
+            self.inv_amount_surf = self.font.render(f"x{inv_amount}", False, "white")
+            self.inv_amount_rect = self.inv_amount_surf.get_rect(center=_TEXT_CENTER)
+
+        if self.player.money != self.money:
+            self.money = self.player.money
+            self.money_surf = self.font.render(f"{self.money}", False, "white")
+            self.money_rect = self.money_surf.get_rect(center=_MONEY_CENTER)
+            self.money_bg_rect = pygame.Rect(
+                self.money_bg_topleft,
+                self.money_rect.inflate(350, 90).clip(self.money_bg_bounds).size,
             )
-        )
 
-        money_bg_surf = pygame.Surface(coin_rect.topleft)
-        money_bg_surf.fill(BG_COLOUR)
-        money_bg_rect = money_bg_surf.get_rect(topleft=coin_rect.topleft).inflate(
-            20, 15
-        )
-        self.display_surface.blit(
-            money_bg_surf,
-            money_bg_rect,
-            money_rect.inflate(350, 90),
-            special_flags=pygame.BLEND_RGBA_MULT,
-        )
+    def draw(self, dt: int) -> None:
+        selected = self.player.inventory.selected
+        tool_surf = self.tools_surf[selected]
+        tool_rect = self.tool_rects[selected]
+
+        coin_surf = self.coin_animation.play_status(dt=dt)
+        coin_rect = self.coin_rect
 
-        tool_bg_surf = pygame.Surface(self.all_tool_rect.topleft)
-        tool_bg_surf.fill(BG_COLOUR)
-        tool_bg_rect = money_bg_surf.get_rect(
-            topleft=self.all_tool_rect.topleft
-        ).inflate(100, 100)
-        self.display_surface.blit(
-            tool_bg_surf,
-            tool_bg_rect,
-            self.all_tool_rect.inflate(300, 400),
-            special_flags=pygame.BLEND_RGBA_MULT,
+        self.update_text()
+
+        self.display_surface.fill(
+            BG_COLOUR, self.money_bg_rect, special_flags=pygame.BLEND_RGBA_MULT
+        )
+        self.display_surface.fill(
+            BG_COLOUR, self.tool_bg_rect, special_flags=pygame.BLEND_RGBA_MULT
         )
 
-        self.display_surface.blit(inv_amount_surf, inv_amount_rect)
-        self.display_surface.blit(money_surf, money_rect)
+        self.display_surface.blit(self.inv_amount_surf, self.inv_amount_rect)
+        self.display_surface.blit(self.money_surf, self.money_rect)
         self.display_surface.blit(tool_surf, tool_rect)
         self.display_surface.blit(coin_surf, coin_rect)
@@ -4,8 +4,24 @@ from pygame.sprite import Group
 from typing import Tuple, Dict
 
 from core.utils import Animation, Timer, ItemIterator, get_path
-from core.settings import Display, LAYERS, PLAYER_TOOL_OFFSET
-from entities.sprites import BaseSprite
+from core.settings import (
+    Display,
+    LAYERS,
+    Direction,
+    DIRECTION_NAMES,
+    PLAYER_TOOL_OFFSET_TUPLE,
+)
+from entities.sprites import BaseSprite, CollisionGroup
+
+_HALF_SCREEN_X = Display.SCREEN_RESOLUTION[0] // 2
+_HALF_SCREEN_Y = Display.SCREEN_RESOLUTION[1] // 2
+
+# Input can only ever produce these 9 directions, so they're normalized once here.
+_NORMALIZED_DIRECTIONS: Dict[Tuple[int, int], pygame.Vector2] = {
+    (dx, dy): (pygame.Vector2(dx, dy).normalize() if dx or dy else pygame.Vector2())
+    for dx in (-1, 0, 1)
+    for dy in (-1, 0, 1)
+}
 
 
 class Player(BaseSprite):
@@ -14,7 +30,7 @@ class Player(BaseSprite):
         pos: Tuple[int, int],
         animation: Animation,
         group: Group,
-        collison_sprites: Group,
+        collison_sprites: CollisionGroup,
         tree_sprites: Group,
         interaction_sprites: Group,
         soil_layer: Group,
@@ -34,7 +50,9 @@ class Player(BaseSprite):
         self.speed = 300
         self.position = pygame.math.Vector2(self.rect.center)
         self.direction = pygame.math.Vector2()
+        self.facing = Direction.DOWN
         self.direction_str = "down"
+        self.tool_offset = PLAYER_TOOL_OFFSET_TUPLE[self.facing]
 
         self.inventory = ItemIterator(
             ["hoe", "axe", "water", "corn", "tomato", "wood", "apple"]
@@ -55,21 +73,29 @@ class Player(BaseSprite):
         self.watering = pygame.mixer.Sound(watering_sound_path)
         self.watering.set_volume(0.2)
 
-    def get_target_pos(self) -> pygame.Vector2:
-        return self.rect.center + PLAYER_TOOL_OFFSET[self.direction_str]
+    def face(self, direction: Direction) -> None:
+        self.facing = direction
+        self.direction_str = DIRECTION_NAMES[direction]
+        self.tool_offset = PLAYER_TOOL_OFFSET_TUPLE[direction]
+
+    def get_target_pos(self) -> Tuple[float, float]:
+        offset = self.tool_offset
+        return (self.rect.centerx + offset.x, self.rect.centery + offset.y)
 
     def use_tool(self) -> None:
+        target_pos = self.get_target_pos()
+
         if self.inventory.selected == "hoe":
-            self.soil_layer.get_hit(self.get_target_pos())
+            self.soil_layer.get_hit(target_pos)
 
         elif self.inventory.selected == "axe":
-            for tree in self.tree_sprites.sprites():
-                if tree.rect.collidepoint(self.get_target_pos()):
+            for tree in self.tree_sprites:
+                if tree.rect.collidepoint(target_pos):
                     tree.damage()
 
         elif self.inventory.selected == "water":
             self.watering.play()
-            self.soil_layer.water(self.get_target_pos())
+            self.soil_layer.water(target_pos)
 
         elif self.inventory.selected in ("corn", "tomato"):
             self.timers["seed_use"].activate()
@@ -83,11 +109,12 @@ class Player(BaseSprite):
 
     def interact(self) -> None:
         interacted = False
+        target_pos = self.get_target_pos()
 
         if not interacted:
             # Grabbing apples
-            for tree in self.tree_sprites.sprites():
-                if tree.rect.collidepoint(self.get_target_pos()):
+            for tree in self.tree_sprites:
+                if tree.rect.collidepoint(target_pos):
                     tree.interact()
                     interacted = True
 
@@ -101,40 +128,40 @@ class Player(BaseSprite):
                     self.toggle_active = not self.toggle_active
 
                 elif collided_interaction_sprite[0].name == "Bed":
-                    self.direction_str = "left"
+                    self.face(Direction.LEFT)
                     self.animation.set_status("idle_left")
                     self.sleep = True
 
     def input(self, dt: int) -> None:
         # User input system
+        status = None
         if not self.timers["tool_use"].active and not self.sleep:
             keys = pygame.key.get_pressed()
             if keys[pygame.K_w] or keys[pygame.K_UP]:
-                self.direction.y = -1
-                self.direction_str = "up"
-                self.animation.set_status(self.direction_str)
+                dy = -1
             elif keys[pygame.K_s] or keys[pygame.K_DOWN]:
-                self.direction.y = 1
-                self.direction_str = "down"
-                self.animation.set_status(self.direction_str)
+                dy = 1
             else:
-                self.direction.y = 0
+                dy = 0
 
             if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-                self.direction.x = -1
-                self.direction_str = "left"
-                self.animation.set_status(self.direction_str)
+                dx = -1
             elif keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-                self.direction.x = 1
-                self.direction_str = "right"
-                self.animation.set_status(self.direction_str)
+                dx = 1
             else:
-                self.direction.x = 0
+                dx = 0
+
+            # Horizontal movement takes priority for the facing direction.
+            if dx:
+                self.face(Direction.LEFT if dx < 0 else Direction.RIGHT)
+            elif dy:
+                self.face(Direction.UP if dy < 0 else Direction.DOWN)
 
-            if self.direction.length() != 0.0:
-                self.direction.normalize_ip()
+            self.direction.update(_NORMALIZED_DIRECTIONS[dx, dy])
+            if dx or dy:
+                status = self.direction_str
             else:
-                self.animation.set_status(f"{self.direction_str}_idle")
+                status = f"{self.direction_str}_idle"
 
             # Interactions / using tools
             if keys[pygame.K_f]:
@@ -153,7 +180,10 @@ class Player(BaseSprite):
                 self.inventory.previous()
 
         if self.timers["tool_use"].active:
-            self.animation.set_status(f"{self.direction_str}_{self.inventory.selected}")
+            status = f"{self.direction_str}_{self.inventory.selected}"
+
+        if status is not None:
+            self.animation.set_status(status)
 
         # Updating the player's postition
         # Horizontal movement
@@ -169,34 +199,38 @@ class Player(BaseSprite):
         self.collide(horizontal=False)
 
     def collide(self, *, horizontal: bool) -> None:
-        for sprite in self.collision_sprites.sprites():
-            if hasattr(sprite, "hitbox"):
-                if sprite.hitbox.colliderect(self.hitbox):
-                    if horizontal:
-                        if self.direction.x > 0:  # moving right
-                            self.hitbox.right = sprite.hitbox.left
-                        if self.direction.x < 0:  # moving left
-                            self.hitbox.left = sprite.hitbox.right
-                        self.rect.centerx = self.hitbox.centerx
-                        self.position.x = self.hitbox.centerx
-
-                    else:
-                        if self.direction.y > 0:  # moving down
-                            self.hitbox.bottom = sprite.hitbox.top
-                        if self.direction.y < 0:  # moving up
-                            self.hitbox.top = sprite.hitbox.bottom
-                        self.rect.centery = self.hitbox.centery
-                        self.position.y = self.hitbox.centery
+        sprites = self.collision_sprites.near(self.hitbox)
+        # Broadphase in C, each hit is re-checked below since resolving one
+        # collision moves the hitbox.
+        for index in self.hitbox.collidelistall([sprite.hitbox for sprite in sprites]):
+            sprite = sprites[index]
+            if sprite.hitbox.colliderect(self.hitbox):
+                if horizontal:
+                    if self.direction.x > 0:  # moving right
+                        self.hitbox.right = sprite.hitbox.left
+                    if self.direction.x < 0:  # moving left
+                        self.hitbox.left = sprite.hitbox.right
+                    self.rect.centerx = self.hitbox.centerx
+                    self.position.x = self.hitbox.centerx
+
+                else:
+                    if self.direction.y > 0:  # moving down
+                        self.hitbox.bottom = sprite.hitbox.top
+                    if self.direction.y < 0:  # moving up
+                        self.hitbox.top = sprite.hitbox.bottom
+                    self.rect.centery = self.hitbox.centery
+                    self.position.y = self.hitbox.centery
 
     def update_timers(self) -> None:
+        current_time = pygame.time.get_ticks()
         for timer in self.timers.values():
-            timer.update()
+            if timer.active:
+                timer.update(current_time)
 
     def update(self, dt: int) -> None:
         self.input(dt=dt)
         # self.use_tool()
         self.update_timers()
-        self.get_target_pos()
         self.image = self.animation.play_status(dt=dt)
 
 
@@ -204,17 +238,19 @@ class CameraGroup(Group):
     def __init__(self, window: pygame.Surface):
         super().__init__()
         self.window = window
-        self.offset = pygame.math.Vector2()
+        self.offset: Tuple[int, int] = (0, 0)
 
     def draw(self, player: Player) -> None:
-        self.offset.x = player.rect.centerx - Display.SCREEN_RESOLUTION[0] / 2
-        self.offset.y = player.rect.centery - Display.SCREEN_RESOLUTION[1] / 2
-
-        for layer in LAYERS.values():
-            for sprite in sorted(
-                self.sprites(), key=lambda sprite: sprite.rect.centery
-            ):
-                if sprite.z == layer:
-                    offset_rect = sprite.rect.copy()
-                    offset_rect.center -= self.offset
-                    self.window.blit(sprite.image, offset_rect)
+        ox = player.rect.centerx - _HALF_SCREEN_X
+        oy = player.rect.centery - _HALF_SCREEN_Y
+        self.offset = (ox, oy)
+
+        self.window.fblits(
+            [
+                (sprite.image, (sprite.rect.x - ox, sprite.rect.y - oy))
+                for sprite in sorted(
+                    self.sprites(),
+                    key=lambda sprite: (sprite.z, sprite.rect.centery),
+                )
+            ]
+        )
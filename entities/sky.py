@@ -1,12 +1,23 @@
 import pygame
 import random
 
+from typing import List
+
 from core.settings import *
-from core.utils import import_folder
+from core.utils import import_folder, load_image, asset
+from entities.player import CameraGroup
 from entities.sprites import BaseSprite
 
 
 class Sky:
+    __slots__ = (
+        "display_surface",
+        "full_surf",
+        "start_color",
+        "end_color",
+        "day_speed",
+    )
+
     def __init__(self, display: pygame.Surface) -> None:
         self.display_surface = display
         self.full_surf = pygame.Surface(Display.SCREEN_RESOLUTION)
@@ -15,9 +26,11 @@ class Sky:
         self.day_speed = 1.2
 
     def display(self, dt: int) -> None:
-        for index, value in enumerate(self.end_color):
-            if self.start_color[index] > value:
-                self.start_color[index] -= self.day_speed * dt
+        step = self.day_speed * dt
+        self.start_color = [
+            max(current - step, end)
+            for current, end in zip(self.start_color, self.end_color)
+        ]
 
         self.full_surf.fill(self.start_color)
         self.display_surface.blit(
@@ -30,7 +43,6 @@ class Drop(BaseSprite):
         self,
         surf: pygame.Surface,
         pos: Tuple[int, int],
-        moving: bool,
         groups: Union[pygame.sprite.Group, Sequence[pygame.sprite.Group]],
         z: int,
     ) -> None:
@@ -39,58 +51,87 @@ class Drop(BaseSprite):
         self.lifetime = random.randint(400, 500)
         self.start_time = pygame.time.get_ticks()
 
-        # moving
-        self.moving = moving
-        if self.moving:
-            self.pos = pygame.math.Vector2(self.rect.topleft)
-            self.direction = pygame.math.Vector2(-2, 4)
-            self.speed = random.randint(200, 250)
-
     def update(self, dt: int) -> None:
-        # movement
-        if self.moving:
-            self.pos += self.direction * self.speed * dt
-            self.rect.topleft = (round(self.pos.x), round(self.pos.y))
-
         # timer
         if pygame.time.get_ticks() - self.start_time >= self.lifetime:
             self.kill()
 
 
+class RainDrop:
+    """A falling drop. These aren't sprites, `Rain` moves & draws them all itself
+    since they're always drawn above every other layer."""
+
+    __slots__ = ("surf", "x", "y", "speed", "expire_time")
+
+    def __init__(self, surf: pygame.Surface, pos: Tuple[int, int]) -> None:
+        self.surf = surf
+        self.x, self.y = pos
+        self.speed = random.randint(200, 250)
+        self.expire_time = pygame.time.get_ticks() + random.randint(400, 500)
+
+
 class Rain:
-    def __init__(
-        self, display: pygame.Surface, all_sprites: pygame.sprite.Group
-    ) -> None:
+    __slots__ = (
+        "display_window",
+        "all_sprites",
+        "rain_drops",
+        "rain_floor",
+        "floor_w",
+        "floor_h",
+        "drops",
+    )
+
+    def __init__(self, display: pygame.Surface, all_sprites: CameraGroup) -> None:
         self.display_window = display
         self.all_sprites = all_sprites
         self.rain_drops = import_folder("graphics/images/rain/drops")
         self.rain_floor = import_folder("graphics/images/rain/floor")
-        self.floor_w, self.floor_h = pygame.image.load(
-            "graphics/images/world/ground.png"
+        self.floor_w, self.floor_h = load_image(
+            asset("images", "world", "ground.png")
         ).get_size()
+        self.drops: List[RainDrop] = []
 
     def create_floor(self) -> None:
         Drop(
             surf=random.choice(self.rain_floor),
             pos=(random.randint(0, self.floor_w), random.randint(0, self.floor_h)),
-            moving=False,
             groups=self.all_sprites,
-            z=LAYERS["rain_floor"],
+            z=LAYER_RAIN_FLOOR,
         )
 
     def create_drops(self) -> None:
-        Drop(
-            surf=random.choice(self.rain_drops),
-            pos=(random.randint(0, self.floor_w), random.randint(0, self.floor_h)),
-            moving=True,
-            groups=self.all_sprites,
-            z=LAYERS["rain_drops"],
+        self.drops.append(
+            RainDrop(
+                surf=random.choice(self.rain_drops),
+                pos=(random.randint(0, self.floor_w), random.randint(0, self.floor_h)),
+            )
+        )
+
+    def update_drops(self, dt: int) -> None:
+        current_time = pygame.time.get_ticks()
+        self.drops = [drop for drop in self.drops if drop.expire_time > current_time]
+        for drop in self.drops:
+            step = drop.speed * dt
+            drop.x -= 2 * step
+            drop.y += 4 * step
+
+    def draw(self) -> None:
+        """Draws the falling drops with the camera offset of the last
+        `CameraGroup.draw`."""
+
+        ox, oy = self.all_sprites.offset
+        self.display_window.fblits(
+            [
+                (drop.surf, (round(drop.x) - ox, round(drop.y) - oy))
+                for drop in self.drops
+            ]
         )
 
     def dim_screen(self) -> None:
         self.display_window.fill((200, 200, 200), special_flags=pygame.BLEND_RGBA_MULT)
 
-    def update(self) -> None:
+    def update(self, dt: int) -> None:
         self.dim_screen()
         self.create_floor()
         self.create_drops()
+        self.update_drops(dt)
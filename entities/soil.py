@@ -2,19 +2,28 @@ import pygame
 import random
 
 from pytmx.util_pygame import load_pygame
-from typing import Tuple, List
+from typing import Tuple, List, Set, Dict, Optional
 
 from core.settings import *
-from core.utils import import_folder, import_folder_dict, get_path
+from core.utils import import_folder, import_folder_dict, load_image, asset, get_path
 from entities.player import Player
 
+# Maps every cell value to itself with the watered flag cleared.
+_CLEAR_WATERED = bytes(cell & ~SOIL_WATERED for cell in range(256))
+# Maps every cell value to just its tilled flag.
+_ONLY_TILLED = bytes(cell & SOIL_TILLED for cell in range(256))
+# Maps every cell value to 1 if it's tilled but not watered yet, else 0.
+_NEEDS_WATER = bytes(
+    int(bool(cell & SOIL_TILLED) and not cell & SOIL_WATERED) for cell in range(256)
+)
+
 
 class SoilTile(pygame.sprite.Sprite):
     def __init__(self, pos, surf, groups):
         super().__init__(groups)
         self.image = surf
         self.rect = self.image.get_rect(topleft=pos)
-        self.z = LAYERS["soil"]
+        self.z = LAYER_SOIL
 
 
 class WaterTile(pygame.sprite.Sprite):
@@ -24,7 +33,7 @@ class WaterTile(pygame.sprite.Sprite):
         super().__init__(groups)
         self.image = surf
         self.rect = self.image.get_rect(topleft=pos)
-        self.z = LAYERS["soil_water"]
+        self.z = LAYER_SOIL_WATER
 
 
 class Plant(pygame.sprite.Sprite):
@@ -51,33 +60,58 @@ class Plant(pygame.sprite.Sprite):
         self.harvestable = False
 
         # sprite setup
-        self.image = self.frames[self.age]
+        self.frame_index = 0
+        self.image = self.frames[self.frame_index]
         self.y_offset = -16 if plant_type == "corn" else -8
-        self.rect = self.image.get_rect(
-            midbottom=soil.rect.midbottom + pygame.math.Vector2(0, self.y_offset)
-        )
-        self.z = LAYERS["ground_plant"]
+        self.midbottom = (soil.rect.centerx, soil.rect.bottom + self.y_offset)
+        self.rect = self.image.get_rect(midbottom=self.midbottom)
+        self.z = LAYER_GROUND_PLANT
+        # Seedlings can be walked over, an empty hitbox never collides.
+        self.hitbox = pygame.Rect(self.rect.midbottom, (0, 0))
 
     def grow(self) -> None:
+        if self.harvestable:
+            return
+
         if self.check_watered(self.rect.center):
             self.age += self.grow_speed
 
-            if int(self.age) > 0:
-                self.z = LAYERS["main"]
-                self.hitbox = self.rect.copy().inflate(-26, -self.rect.height * 0.4)
-
             if self.age >= self.max_age:
                 self.age = self.max_age
                 self.harvestable = True
 
-            self.image = self.frames[int(self.age)]
-            self.rect = self.image.get_rect(
-                midbottom=self.soil.rect.midbottom
-                + pygame.math.Vector2(0, self.y_offset)
-            )
+            # Fractional grow speeds don't always reach the next frame.
+            frame_index = int(self.age)
+            if frame_index != self.frame_index:
+                self.frame_index = frame_index
+                self.image = self.frames[frame_index]
+                self.rect = self.image.get_rect(midbottom=self.midbottom)
+
+                self.z = LAYER_MAIN
+                self.hitbox = self.rect.copy().inflate(-26, -self.rect.height * 0.4)
 
 
 class SoilLayer:
+    # Neighbouring tilled tiles packed as 0bTRBL -> soil surface name.
+    _AUTOTILE: Dict[int, str] = {
+        0b0000: "o",
+        0b0001: "r",
+        0b0010: "t",
+        0b0011: "tr",
+        0b0100: "l",
+        0b0101: "lr",
+        0b0110: "tl",
+        0b0111: "lrt",
+        0b1000: "b",
+        0b1001: "br",
+        0b1010: "tb",
+        0b1011: "tbl",
+        0b1100: "bl",
+        0b1101: "lrb",
+        0b1110: "tbr",
+        0b1111: "x",
+    }
+
     def __init__(
         self,
         all_sprites: pygame.sprite.Sprite,
@@ -88,6 +122,8 @@ class SoilLayer:
         self.all_sprites = all_sprites
         self.collision_sprites = collision_sprites
         self.soil_sprites = pygame.sprite.Group()
+        self.soil_sprite_grid: Dict[Tuple[int, int], SoilTile] = {}
+        self.soil_tile_groups = (self.all_sprites, self.soil_sprites)
         self.water_sprites = pygame.sprite.Group()
         self.plant_sprites = pygame.sprite.Group()
 
@@ -97,7 +133,8 @@ class SoilLayer:
         self.water_surfs = import_folder("graphics/images/soil_water")
 
         self.create_soil_grid()
-        self.create_hit_rects()
+        self.create_farmable_tiles()
+        self.create_soil_tiles()
 
         self.soil_coords: List[Vector2] = []
 
@@ -111,163 +148,144 @@ class SoilLayer:
         self.plant_sound.set_volume(0.2)
 
     def create_soil_grid(self) -> None:
-        ground_path = "graphics/images/world/ground.png"
-        ground = pygame.image.load(ground_path)
+        ground = load_image(asset("images", "world", "ground.png"))
         h_tiles, v_tiles = (
             ground.get_width() // TILE_SIZE,
             ground.get_height() // TILE_SIZE,
         )
 
-        self.grid = [[[] for col in range(h_tiles)] for row in range(v_tiles)]
+        # One byte of SOIL_* flags per tile.
+        self.grid = [bytearray(h_tiles) for row in range(v_tiles)]
         map_tmx = "graphics/data/map.tmx"
         for x, y, _ in load_pygame(map_tmx).get_layer_by_name("Farmable").tiles():
-            self.grid[y][x].append("F")
-
-    def create_hit_rects(self) -> None:
-        self.hit_rects = []
-        for index_row, row in enumerate(self.grid):
-            for index_col, cell in enumerate(row):
-                if "F" in cell:
-                    x = index_col * TILE_SIZE
-                    y = index_row * TILE_SIZE
-                    rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
-                    self.hit_rects.append(rect)
-
-    def get_hit(self, point: Vector2) -> None:
-        for rect in self.hit_rects:
-            if rect.collidepoint(point):
-                self.hoe_sound.play()
-
-                x = rect.x // TILE_SIZE
-                y = rect.y // TILE_SIZE
-
-                if "F" in self.grid[y][x]:
-                    self.grid[y][x].append("X")
-                    self.create_soil_tiles()
-                    self.soil_coords.append(list(point))
-                    if self.raining:
-                        self.water_all()
+            self.grid[y][x] |= SOIL_FARMABLE
+
+    def create_farmable_tiles(self) -> None:
+        self.farmable_tiles: Set[Tuple[int, int]] = {
+            (index_col, index_row)
+            for index_row, row in enumerate(self.grid)
+            for index_col, cell in enumerate(row)
+            if cell & SOIL_FARMABLE
+        }
+
+    def get_hit(self, point: Tuple[float, float]) -> None:
+        x = int(point[0] // TILE_SIZE)
+        y = int(point[1] // TILE_SIZE)
+
+        if (x, y) in self.farmable_tiles:
+            self.hoe_sound.play()
+
+            if self.grid[y][x] & SOIL_FARMABLE:
+                self.grid[y][x] |= SOIL_TILLED
+                self.update_soil_tiles(x, y)
+                self.soil_coords.append(list(point))
+                if self.raining:
+                    self.water_all()
+
+    def get_soil_sprite(self, pos: Tuple[float, float]) -> Optional[SoilTile]:
+        return self.soil_sprite_grid.get(
+            (int(pos[0] // TILE_SIZE), int(pos[1] // TILE_SIZE))
+        )
 
     def water(self, target_pos: Tuple[int, int]) -> None:
-        for soil_sprite in self.soil_sprites.sprites():
-            if soil_sprite.rect.collidepoint(target_pos):
-                x = soil_sprite.rect.x // TILE_SIZE
-                y = soil_sprite.rect.y // TILE_SIZE
-                self.grid[y][x].append("W")
+        soil_sprite = self.get_soil_sprite(target_pos)
+        if soil_sprite is not None:
+            x = soil_sprite.rect.x // TILE_SIZE
+            y = soil_sprite.rect.y // TILE_SIZE
+            self.grid[y][x] |= SOIL_WATERED
 
-                pos = soil_sprite.rect.topleft
-                surf = random.choice(self.water_surfs)
-                WaterTile(pos, surf, [self.all_sprites, self.water_sprites])
+            pos = soil_sprite.rect.topleft
+            surf = random.choice(self.water_surfs)
+            WaterTile(pos, surf, [self.all_sprites, self.water_sprites])
 
     def water_all(self) -> None:
-        for index_row, row in enumerate(self.grid):
-            for index_col, cell in enumerate(row):
-                if "X" in cell and "W" not in cell:
-                    cell.append("W")
+        water_surfs = self.water_surfs
+        groups = (self.all_sprites, self.water_sprites)
 
-                    x = index_col * TILE_SIZE
-                    y = index_row * TILE_SIZE
-                    surf = random.choice(self.water_surfs)
-                    WaterTile((x, y), surf, [self.all_sprites, self.water_sprites])
+        for index_row, row in enumerate(self.grid):
+            dry = row.translate(_NEEDS_WATER)
+            index_col = dry.find(1)
+            y = index_row * TILE_SIZE
+            while index_col != -1:
+                row[index_col] |= SOIL_WATERED
+                WaterTile(
+                    (index_col * TILE_SIZE, y), random.choice(water_surfs), groups
+                )
+                index_col = dry.find(1, index_col + 1)
 
     def remove_water(self) -> None:
         # destroy all water sprites
-        for sprite in self.water_sprites.sprites():
+        for sprite in self.water_sprites:
             sprite.kill()
 
         # clean up the grid
-        for row in self.grid:
-            for cell in row:
-                if "W" in cell:
-                    cell.remove("W")
+        self.grid = [row.translate(_CLEAR_WATERED) for row in self.grid]
 
-    def check_watered(self, pos: Tuple[int, int]) -> None:
+    def check_watered(self, pos: Tuple[int, int]) -> bool:
         x = pos[0] // TILE_SIZE
         y = pos[1] // TILE_SIZE
-        cell = self.grid[y][x]
-        is_watered = "W" in cell
-        return is_watered
+        return bool(self.grid[y][x] & SOIL_WATERED)
 
     def plant_seed(
         self, target_pos: Tuple[int, int], seed: str, player: Player
     ) -> None:
-        for soil_sprite in self.soil_sprites.sprites():
-            if soil_sprite.rect.collidepoint(target_pos):
-                self.plant_sound.play()
-
-                x = soil_sprite.rect.x // TILE_SIZE
-                y = soil_sprite.rect.y // TILE_SIZE
-
-                if "P" not in self.grid[y][x]:
-                    self.grid[y][x].append("P")
-                    Plant(
-                        seed,
-                        [self.all_sprites, self.plant_sprites, self.collision_sprites],
-                        soil_sprite,
-                        self.check_watered,
-                    )
-                    player.inventory.update_item(-1)
+        soil_sprite = self.get_soil_sprite(target_pos)
+        if soil_sprite is not None:
+            self.plant_sound.play()
+
+            x = soil_sprite.rect.x // TILE_SIZE
+            y = soil_sprite.rect.y // TILE_SIZE
+
+            if not self.grid[y][x] & SOIL_PLANTED:
+                self.grid[y][x] |= SOIL_PLANTED
+                Plant(
+                    seed,
+                    [self.all_sprites, self.plant_sprites, self.collision_sprites],
+                    soil_sprite,
+                    self.check_watered,
+                )
+                player.inventory.update_item(-1)
 
     def update_plants(self) -> None:
-        for plant in self.plant_sprites.sprites():
+        for plant in self.plant_sprites:
             plant.grow()
 
+    def _compute_tile_type(self, x: int, y: int) -> str:
+        # tile options
+        t = (self.grid[y - 1][x] & SOIL_TILLED) != 0
+        r = (self.grid[y][x + 1] & SOIL_TILLED) != 0
+        b = (self.grid[y + 1][x] & SOIL_TILLED) != 0
+        l = (self.grid[y][x - 1] & SOIL_TILLED) != 0
+
+        return self._AUTOTILE[(t << 3) | (r << 2) | (b << 1) | l]
+
+    def _update_tile(self, x: int, y: int) -> None:
+        old_tile = self.soil_sprite_grid.pop((x, y), None)
+        if old_tile is not None:
+            old_tile.kill()
+
+        if self.grid[y][x] & SOIL_TILLED:
+            self.soil_sprite_grid[x, y] = SoilTile(
+                pos=(x * TILE_SIZE, y * TILE_SIZE),
+                surf=self.soil_surfs[self._compute_tile_type(x, y)],
+                groups=self.soil_tile_groups,
+            )
+
+    def update_soil_tiles(self, x: int, y: int) -> None:
+        self._update_tile(x, y)
+        for neighbour in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+            if neighbour in self.soil_sprite_grid:
+                self._update_tile(*neighbour)
+
     def create_soil_tiles(self) -> None:
-        self.soil_sprites.empty()
+        for sprite in self.soil_sprites:
+            sprite.kill()
+        self.soil_sprite_grid.clear()
+
+        # Only visit the tilled cells, bytes.find does the scanning.
         for index_row, row in enumerate(self.grid):
-            for index_col, cell in enumerate(row):
-                if "X" in cell:
-
-                    # tile options
-                    t = "X" in self.grid[index_row - 1][index_col]
-                    b = "X" in self.grid[index_row + 1][index_col]
-                    r = "X" in row[index_col + 1]
-                    l = "X" in row[index_col - 1]
-
-                    tile_type = "o"
-
-                    # all sides
-                    if all((t, r, b, l)):
-                        tile_type = "x"
-
-                    # horizontal tiles only
-                    if l and not any((t, r, b)):
-                        tile_type = "r"
-                    if r and not any((t, l, b)):
-                        tile_type = "l"
-                    if r and l and not any((t, b)):
-                        tile_type = "lr"
-
-                    # vertical only
-                    if t and not any((r, l, b)):
-                        tile_type = "b"
-                    if b and not any((r, l, t)):
-                        tile_type = "t"
-                    if b and t and not any((r, l)):
-                        tile_type = "tb"
-
-                    # corners
-                    if l and b and not any((t, r)):
-                        tile_type = "tr"
-                    if r and b and not any((t, l)):
-                        tile_type = "tl"
-                    if l and t and not any((b, r)):
-                        tile_type = "br"
-                    if r and t and not any((b, l)):
-                        tile_type = "bl"
-
-                    # T shapes
-                    if all((t, b, r)) and not l:
-                        tile_type = "tbr"
-                    if all((t, b, l)) and not r:
-                        tile_type = "tbl"
-                    if all((l, r, t)) and not b:
-                        tile_type = "lrb"
-                    if all((l, r, b)) and not t:
-                        tile_type = "lrt"
-
-                    SoilTile(
-                        pos=(index_col * TILE_SIZE, index_row * TILE_SIZE),
-                        surf=self.soil_surfs[tile_type],
-                        groups=[self.all_sprites, self.soil_sprites],
-                    )
+            tilled = row.translate(_ONLY_TILLED)
+            index_col = tilled.find(SOIL_TILLED)
+            while index_col != -1:
+                self._update_tile(index_col, index_row)
+                index_col = tilled.find(SOIL_TILLED, index_col + 1)
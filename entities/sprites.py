@@ -1,10 +1,30 @@
 import pygame
 import random
-
-from typing import Tuple, Union, Sequence, TypeAlias, Literal, TYPE_CHECKING
-
-from core.settings import WATER_ANIMATIONS, APPLE_POS, LAYERS
-from core.utils import Animation, Timer, import_folder, get_path
+import functools
+
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    Sequence,
+    TypeAlias,
+    Literal,
+    TYPE_CHECKING,
+)
+
+from core.settings import WATER_ANIMATIONS, APPLE_POS, LAYERS, TILE_SIZE
+from core.utils import (
+    Animation,
+    Timer,
+    import_folder,
+    load_image,
+    load_sound,
+    asset,
+    get_path,
+)
 
 if TYPE_CHECKING:
     from entities.player import Player
@@ -16,6 +36,63 @@ else:
 GroupParam: TypeAlias = Union[pygame.sprite.Group, Sequence[pygame.sprite.Group]]
 
 
+class CollisionGroup(pygame.sprite.Group):
+    """A sprite group that also buckets its sprites into a coarse grid of cells by
+    their rect, so collisions only need to be checked against nearby sprites.
+
+    Sprites join their groups before they've set their rect, so new sprites are only
+    placed into cells on the next `CollisionGroup.near` call."""
+
+    def __init__(self, *sprites, cell_size: int = TILE_SIZE * 4) -> None:
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], Dict[pygame.sprite.Sprite, None]] = {}
+        self.sprite_cells: Dict[pygame.sprite.Sprite, List[Tuple[int, int]]] = {}
+        self.pending: Dict[pygame.sprite.Sprite, None] = {}
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite: pygame.sprite.Sprite, layer=None) -> None:
+        super().add_internal(sprite, layer)
+        self.pending[sprite] = None
+
+    def remove_internal(self, sprite: pygame.sprite.Sprite) -> None:
+        super().remove_internal(sprite)
+
+        self.pending.pop(sprite, None)
+        for cell in self.sprite_cells.pop(sprite, ()):
+            del self.cells[cell][sprite]
+
+    def index_pending(self) -> None:
+        cell_size = self.cell_size
+        for sprite in self.pending:
+            rect = sprite.rect
+            cells = [
+                (x, y)
+                for x in range(rect.left // cell_size, rect.right // cell_size + 1)
+                for y in range(rect.top // cell_size, rect.bottom // cell_size + 1)
+            ]
+            self.sprite_cells[sprite] = cells
+            for cell in cells:
+                self.cells.setdefault(cell, {})[sprite] = None
+        self.pending.clear()
+
+    def near(self, rect: pygame.Rect) -> List[pygame.sprite.Sprite]:
+        """Gets the sprites in the cells overlapping `rect` & the cells right next to
+        them. The extra ring of cells covers sprites whose rect has changed size since
+        they were added (grown plants, tree stumps)."""
+
+        if self.pending:
+            self.index_pending()
+
+        cell_size = self.cell_size
+        cells = self.cells
+        found: Dict[pygame.sprite.Sprite, None] = {}
+        for x in range(rect.left // cell_size - 1, rect.right // cell_size + 2):
+            for y in range(rect.top // cell_size - 1, rect.bottom // cell_size + 2):
+                if (x, y) in cells:
+                    found.update(cells[(x, y)])
+        return list(found)
+
+
 class BaseSprite(pygame.sprite.Sprite):
     def __init__(
         self,
@@ -32,6 +109,22 @@ class BaseSprite(pygame.sprite.Sprite):
             -self.rect.width * 0.2, -self.rect.height * 0.75
         )
 
+    @classmethod
+    def bulk_create(
+        cls,
+        entries: Iterable[Tuple[Tuple[int, int], pygame.Surface]],
+        group: GroupParam,
+        z: int,
+    ) -> List["BaseSprite"]:
+        """Creates a sprite for every `(pos, surf)` entry & adds them all to the
+        group(s) in one call each, instead of once per sprite."""
+
+        sprites = [cls(pos, surf, (), z) for pos, surf in entries]
+        groups = (group,) if isinstance(group, pygame.sprite.AbstractGroup) else group
+        for sprite_group in groups:
+            sprite_group.add(sprites)
+        return sprites
+
 
 class Interaction(BaseSprite):
     def __init__(
@@ -47,6 +140,15 @@ class Interaction(BaseSprite):
         self.name = name
 
 
+@functools.lru_cache(maxsize=None)
+def _white_surface(surf: pygame.Surface) -> pygame.Surface:
+    # Particles only ever flash a handful of cached surfaces (apples, stumps & plant
+    # frames), so each white version is only built once.
+    new_surf = pygame.mask.from_surface(surf).to_surface()
+    new_surf.set_colorkey((0, 0, 0))
+    return new_surf
+
+
 class Particle(BaseSprite):
     def __init__(
         self,
@@ -61,10 +163,7 @@ class Particle(BaseSprite):
         self.duration = duration
 
         # white surface
-        mask_surf = pygame.mask.from_surface(self.image)
-        new_surf = mask_surf.to_surface()
-        new_surf.set_colorkey((0, 0, 0))
-        self.image = new_surf
+        self.image = _white_surface(self.image)
 
     def update(self, *args) -> None:
         current_time = pygame.time.get_ticks()
@@ -73,17 +172,26 @@ class Particle(BaseSprite):
 
 
 class Water(BaseSprite):
+    # Every water tile shows the same frame, so they all share one animation which is
+    # advanced once per frame by `Water.animate`.
+    animation: Optional[Animation] = None
+
     def __init__(self, pos: Tuple[int, int], group: GroupParam, z: int) -> None:
+        if Water.animation is None:
+            Water.animation = Animation(
+                {"water": [image for image in import_folder(WATER_ANIMATIONS)]},
+                start_status="water",
+            )
+        super().__init__(pos, Water.animation.get_frame(0), group, z)
 
-        self.animation = Animation(
-            {"water": [image for image in import_folder(WATER_ANIMATIONS)]},
-            start_status="water",
-            sprite=self,
-        )
-        super().__init__(pos, self.animation.get_frame(0), group, z)
+    @staticmethod
+    def animate(water_sprites: pygame.sprite.Group, dt: int) -> None:
+        if Water.animation is None:
+            return
 
-    def update(self, dt: int) -> None:
-        self.animation.play_status_ip(dt=dt)
+        frame = Water.animation.play_status(dt=dt)
+        for sprite in water_sprites:
+            sprite.image = frame
 
 
 class Wildflower(BaseSprite):
@@ -116,7 +224,7 @@ class Tree(BaseSprite):
         )
         self.player = player
 
-        self.apple_surf = pygame.image.load("graphics/images/fruit/apple.png")
+        self.apple_surf = load_image(asset("images", "fruit", "apple.png"))
         self.apple_pos = APPLE_POS[name]
         self.apple_sprites = pygame.sprite.Group()
         self.all_sprites = all_sprites
@@ -124,15 +232,13 @@ class Tree(BaseSprite):
 
         self.invul_timer = Timer(200)
         self.health = 5
-        self.stump_surf = pygame.image.load(
-            f"graphics/images/stumps/{name.lower()}.png"
-        ).convert_alpha()
+        self.stump_surf = load_image(asset("images", "stumps", f"{name.lower()}.png"))
 
         axe_sound_path = get_path("../audio/axe.mp3")
-        self.axe_sound = pygame.mixer.Sound(axe_sound_path)
+        self.axe_sound = load_sound(axe_sound_path)
 
         interact_sound_path = get_path("../audio/interact.wav")
-        self.interact_sound = pygame.mixer.Sound(interact_sound_path)
+        self.interact_sound = load_sound(interact_sound_path)
         self.interact_sound.set_volume(0.2)
 
         self.create_apple()
@@ -161,18 +267,21 @@ class Tree(BaseSprite):
             self.image = self.stump_surf
             self.rect = self.image.get_rect(midbottom=self.rect.midbottom)
             self.hitbox = self.rect.copy().inflate(-10, -self.rect.height * 0.95)
-            for apple in self.apple_sprites:
+            apples = self.apple_sprites.sprites()
+            for apple in apples:
                 apple.kill()
-                self.player.inventory.update_item(item="apple")
+            if apples:
+                self.player.inventory.update_item(len(apples), "apple")
             self.player.inventory.update_item(item="wood")
             Particle(
                 self.rect.topleft, self.image, self.all_sprites, LAYERS["fruit"], 300
             )
 
     def interact(self) -> None:
-        if len(self.apple_sprites.sprites()) > 0:
+        apples = self.apple_sprites.sprites()
+        if apples:
             self.interact_sound.play()
-            random_apple = random.choice(self.apple_sprites.sprites())
+            random_apple = random.choice(apples)
             Particle(
                 pos=random_apple.rect.topleft,
                 surf=random_apple.image,
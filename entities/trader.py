@@ -2,7 +2,7 @@ import pygame
 
 from entities.player import Player
 from core.settings import Display, SALE_PRICES, PURCHASE_PRICES
-from core.utils import Timer, get_path
+from core.utils import Timer, asset
 
 
 class Trader:
@@ -10,8 +10,7 @@ class Trader:
         # general setup
         self.player = player
         self.display_surface = pygame.display.get_surface()
-        font_path = get_path("../graphics/LycheeSoda.ttf")
-        self.font = pygame.font.Font(font_path, 30)
+        self.font = pygame.font.Font(asset("LycheeSoda.ttf"), 30)
 
         # options
         self.width = 400
@@ -11,7 +11,10 @@ class Transition:
         self.reset = reset
         self.player = player
 
+        # Fading towards black with surface alpha avoids refilling the whole screen
+        # sized surface every frame.
         self.image = pygame.Surface(Display.SCREEN_RESOLUTION)
+        self.image.fill((0, 0, 0))
         self.color = 255
         self.speed = -2
 
@@ -27,5 +30,5 @@ class Transition:
             self.player.sleep = False
             self.speed = -2
 
-        self.image.fill((self.color, self.color, self.color))
-        self.window.blit(self.image, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        self.image.set_alpha(255 - self.color)
+        self.window.blit(self.image, (0, 0))
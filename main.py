@@ -5,8 +5,8 @@ import pygame
 from pygame import QUIT, KEYDOWN, MOUSEBUTTONDOWN
 from pygame.locals import DOUBLEBUF
 
-from game_state import StateManager
-from game_state.errors import ExitGameError, ExitStateError
+from core import StateManager
+from core.errors import ExitGameError
 
 from core.settings import Display
 from states import GAME_STATES
@@ -37,11 +37,8 @@ class Main:
         self.state_manager.change_state("Game")
 
         while True:
-            try:
-                self.state_manager.run_state()
-            except ExitStateError:
-                # Stuff you can do before a state is going to be changed / reset.
-                pass
+            self.state_manager.run_state()
+            # Stuff you can do before a state is going to be changed / reset.
 
 
 if __name__ == "__main__":
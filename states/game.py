@@ -3,19 +3,36 @@ import pygame
 import random
 
 from pytmx.util_pygame import load_pygame
+from typing import Optional
 
-from game_state import State
+from core import State
 from core.settings import (
     Display,
     BACKGROUND_COLOUR,
     LAYERS,
     TILE_SIZE,
     CHARACTER_ANIMATIONS,
+    SOIL_PLANTED,
+)
+from core.utils import (
+    Animation,
+    import_folder,
+    load_image,
+    load_sound,
+    asset,
+    get_path,
 )
-from core.utils import Animation, import_folder, get_path
 from entities.player import Player, CameraGroup
 from entities.overlay import Overlay
-from entities.sprites import BaseSprite, Particle, Interaction, Water, Wildflower, Tree
+from entities.sprites import (
+    BaseSprite,
+    CollisionGroup,
+    Particle,
+    Interaction,
+    Water,
+    Wildflower,
+    Tree,
+)
 from entities.transition import Transition
 from entities.soil import SoilLayer
 from entities.sky import Rain, Sky
@@ -27,9 +44,10 @@ class Game(State):
         super().__init__()
 
         self.all_sprites = CameraGroup(State.window)  # type: ignore
-        self.collision_sprites = pygame.sprite.Group()
+        self.collision_sprites = CollisionGroup()
         self.tree_sprites = pygame.sprite.Group()
         self.interaction_sprites = pygame.sprite.Group()
+        self.water_sprites = pygame.sprite.Group()
 
         self.sky = Sky(State.window)
         self.rain = Rain(State.window, self.all_sprites)  # type: ignore
@@ -58,7 +76,7 @@ class Game(State):
 
         self.transition = Transition(self.reset, self.player, State.window)
         self.overlay = Overlay(self.player, State.window)  # type: ignore
-        self.tmx_data = load_pygame(get_path("../graphics/data/map.tmx"))
+        self.tmx_data = load_pygame(asset("data", "map.tmx"))
 
         music_path = get_path("../audio/bg_music.mp3")
         self.music = pygame.mixer.Sound(music_path)
@@ -66,7 +84,7 @@ class Game(State):
         self.music.play(loops=-1)
 
         interact_sound_path = get_path("../audio/interact.wav")
-        self.interact_sound = pygame.mixer.Sound(interact_sound_path)
+        self.interact_sound = load_sound(interact_sound_path)
         self.interact_sound.set_volume(0.2)
 
         rain_path = get_path("../audio/rain.wav")
@@ -74,16 +92,35 @@ class Game(State):
         self.rain_sound.set_volume(0.2)
         self.rain_playing = False
 
+        # Snapshot of the world drawn while the trader menu is open.
+        self.paused_scene: Optional[pygame.Surface] = None
+
     def setup(self) -> None:
+        layers = {
+            name: self.tmx_data.get_layer_by_name(name)
+            for name in (
+                "Player",
+                "Collision",
+                "HouseFloor",
+                "HouseFurnitureBottom",
+                "HouseWalls",
+                "HouseFurnitureTop",
+                "Fence",
+                "Trees",
+                "Decoration",
+                "Water",
+            )
+        }
+
         # World Map
         BaseSprite(
             (0, 0),
-            pygame.image.load("graphics/images/world/ground.png").convert_alpha(),
+            load_image(asset("images", "world", "ground.png")),
             self.all_sprites,
             LAYERS["ground"],
         )
 
-        for obj in self.tmx_data.get_layer_by_name("Player"):
+        for obj in layers["Player"]:
             if obj.name == "Start":
                 self.player.position.x = obj.x
                 self.player.position.y = obj.y
@@ -107,37 +144,40 @@ class Game(State):
                 )
 
         # Collision tiles
-        for x, y, _ in self.tmx_data.get_layer_by_name("Collision").tiles():
-            BaseSprite(
-                (x * TILE_SIZE, y * TILE_SIZE),
-                pygame.Surface((TILE_SIZE, TILE_SIZE)),
-                self.collision_sprites,
-                LAYERS["main"],
-            )
+        BaseSprite.bulk_create(
+            [
+                ((x * TILE_SIZE, y * TILE_SIZE), pygame.Surface((TILE_SIZE, TILE_SIZE)))
+                for x, y, _ in layers["Collision"].tiles()
+            ],
+            self.collision_sprites,
+            LAYERS["main"],
+        )
 
         # House furnitures
         for layer in ("HouseFloor", "HouseFurnitureBottom"):
-            for x, y, surface in self.tmx_data.get_layer_by_name(layer).tiles():
-                BaseSprite(
-                    (x * TILE_SIZE, y * TILE_SIZE),
-                    surface,
-                    self.all_sprites,
-                    LAYERS["house_bottom"],
-                )
+            BaseSprite.bulk_create(
+                [
+                    ((x * TILE_SIZE, y * TILE_SIZE), surface)
+                    for x, y, surface in layers[layer].tiles()
+                ],
+                self.all_sprites,
+                LAYERS["house_bottom"],
+            )
         for layer in ("HouseWalls", "HouseFurnitureTop", "Fence"):
-            for x, y, surface in self.tmx_data.get_layer_by_name(layer).tiles():
-                BaseSprite(
-                    (x * TILE_SIZE, y * TILE_SIZE),
-                    surface,
-                    (
-                        self.all_sprites
-                        if layer != "Fence"
-                        else [self.all_sprites, self.collision_sprites]
-                    ),
-                    LAYERS["main"],
-                )
+            BaseSprite.bulk_create(
+                [
+                    ((x * TILE_SIZE, y * TILE_SIZE), surface)
+                    for x, y, surface in layers[layer].tiles()
+                ],
+                (
+                    self.all_sprites
+                    if layer != "Fence"
+                    else [self.all_sprites, self.collision_sprites]
+                ),
+                LAYERS["main"],
+            )
 
-        for obj in self.tmx_data.get_layer_by_name("Trees"):
+        for obj in layers["Trees"]:
             Tree(
                 (obj.x, obj.y),
                 obj.image,
@@ -149,7 +189,7 @@ class Game(State):
             )
 
         # Decorations
-        for obj in self.tmx_data.get_layer_by_name("Decoration"):
+        for obj in layers["Decoration"]:
             Wildflower(
                 (obj.x, obj.y),
                 obj.image,
@@ -158,30 +198,29 @@ class Game(State):
             )
 
         # Water
-        for x, y, surface in self.tmx_data.get_layer_by_name("Water").tiles():
+        for x, y, surface in layers["Water"].tiles():
             Water(
                 (x * TILE_SIZE, y * TILE_SIZE),
-                self.all_sprites,
+                [self.all_sprites, self.water_sprites],
                 LAYERS["water"],
             )
 
     def plant_collision(self) -> None:
-        if self.soil_layer.plant_sprites:
-            for plant in self.soil_layer.plant_sprites.sprites():
-                if plant.harvestable and plant.rect.colliderect(self.player.hitbox):
-                    self.interact_sound.play()
-                    self.player.inventory.update_item(2, plant.plant_type)
-                    plant.kill()
-                    Particle(
-                        plant.rect.topleft,
-                        plant.image,
-                        self.all_sprites,
-                        z=LAYERS["main"],
-                    )
-
-                    x = plant.rect.centerx // TILE_SIZE
-                    y = plant.rect.centery // TILE_SIZE
-                    self.soil_layer.grid[y][x].remove("P")
+        for plant in self.soil_layer.plant_sprites:
+            if plant.harvestable and plant.rect.colliderect(self.player.hitbox):
+                self.interact_sound.play()
+                self.player.inventory.update_item(2, plant.plant_type)
+                plant.kill()
+                Particle(
+                    plant.rect.topleft,
+                    plant.image,
+                    self.all_sprites,
+                    z=LAYERS["main"],
+                )
+
+                x = plant.rect.centerx // TILE_SIZE
+                y = plant.rect.centery // TILE_SIZE
+                self.soil_layer.grid[y][x] &= ~SOIL_PLANTED
 
     def reset(self) -> None:
         self.soil_layer.update_plants()
@@ -193,9 +232,10 @@ class Game(State):
             self.soil_layer.water_all()
         else:
             self.soil_layer.remove_water()
+            self.rain.drops.clear()
 
-        for tree in self.tree_sprites.sprites():
-            for apple in tree.apple_sprites.sprites():
+        for tree in self.tree_sprites:
+            for apple in tree.apple_sprites:
                 apple.kill()
             tree.create_apple()
 
@@ -204,13 +244,25 @@ class Game(State):
     def run(self) -> None:
         while True:
             dt = self.clock.tick(Display.FPS) / 1000
-            self.window.fill(BACKGROUND_COLOUR)
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.manager.exit_game()
+            # Input is polled, so only QUIT matters. The rest of the queue is dropped
+            # without pumping again, so a QUIT can't slip in & get cleared.
+            if pygame.event.get(pygame.QUIT):
+                self.manager.exit_game()
+            pygame.event.clear(pump=False)
+
+            if self.player.toggle_active and self.paused_scene is not None:
+                # The world is frozen while trading, reuse the frame it stopped on.
+                self.window.blit(self.paused_scene, (0, 0))
+            else:
+                self.window.fill(BACKGROUND_COLOUR)
+                self.all_sprites.draw(self.player)
+                if self.raining:
+                    self.rain.draw()
+                self.paused_scene = (
+                    self.window.copy() if self.player.toggle_active else None
+                )
 
-            self.all_sprites.draw(self.player)
             self.overlay.draw(dt=dt)
             self.sky.display(dt=dt)
 
@@ -220,13 +272,14 @@ class Game(State):
                 self.trader.update()
             else:
                 self.all_sprites.update(dt)
+                Water.animate(self.water_sprites, dt)
                 self.plant_collision()
 
                 if self.raining:
                     if not self.rain_playing:
                         self.rain_playing = True
                         self.rain_sound.play(-1)
-                    self.rain.update()
+                    self.rain.update(dt=dt)
                 else:
                     self.rain_playing = False
                     self.rain_sound.stop()